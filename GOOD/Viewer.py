@@ -9,11 +9,16 @@ Listings Viewer (Excel or CSV)
 import io
 import sys
 import os
+import hashlib
 import webbrowser
+from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from PIL import Image, ImageTk
 import tkinter as tk
@@ -23,6 +28,37 @@ from tkinter import filedialog, messagebox
 MAX_W = 640
 MAX_H = 640
 
+# Derived once: every image is fit into the same fixed box
+_DISPLAY_SIZE = (MAX_W, MAX_H)
+_DRAFT_SIZE = (MAX_W * 2, MAX_H * 2)  # shrink-on-load target: stay >= 2x the display box
+
+# Background image loading
+IO_WORKERS = 4
+PREFETCH_AHEAD = 2  # also fetch this many rows after the current one
+REQUEST_TIMEOUT = 20
+
+# Cache limits: decoded PhotoImages (one per URL) and raw downloaded bytes
+IMAGE_CACHE_MAX = 64
+BYTES_CACHE_MAX = 50 * 1024 * 1024
+
+# Already-resized thumbnails persist here across runs (keyed by sha1 of the URL)
+DISK_CACHE_DIR = Path.home() / ".cache" / "listings_viewer" / "thumbs"
+
+
+def _fit_to_display(img: Image.Image) -> Image.Image:
+    """Decode and shrink an opened image to fit the fixed display box (aspect preserved)."""
+    # JPEG shrink-on-load: libjpeg decodes at 1/2, 1/4 or 1/8 scale (no-op for other formats)
+    img.draft("RGB", _DRAFT_SIZE)
+    if img.mode != "RGB":  # JPEGs usually decode straight to RGB; convert() would just copy
+        img = img.convert("RGB")
+    if img.width <= MAX_W and img.height <= MAX_H:
+        return img  # already fits: skip resampling entirely
+    # thumbnail() box-reduces by an integer factor first (reducing_gap) and only runs the
+    # filter over the last <=2x; BILINEAR is enough for that unless the source was huge
+    small = img.width <= _DRAFT_SIZE[0] and img.height <= _DRAFT_SIZE[1]
+    img.thumbnail(_DISPLAY_SIZE, Image.BILINEAR if small else Image.LANCZOS, reducing_gap=2.0)
+    return img
+
 
 @dataclass
 class ListingRow:
@@ -78,9 +114,31 @@ class ListingsViewer(tk.Tk):
         # Data
         self.rows: list[ListingRow] = []
         self.idx: int = -1
-        self.image_cache: Dict[str, ImageTk.PhotoImage] = {}
         self.current_photo: Optional[ImageTk.PhotoImage] = None
 
+        # Bounded LRU caches (oldest first): Tk images, plus raw bytes so evicted
+        # images can be re-decoded without hitting the network again
+        self.image_cache: "OrderedDict[str, ImageTk.PhotoImage]" = OrderedDict()
+        self._bytes_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes_cache_size = 0
+
+        # Images download/decode on a worker pool; PhotoImages are built on the Tk thread
+        self.session = self._make_session()
+        self._io = ThreadPoolExecutor(max_workers=IO_WORKERS)
+        self._pending: Dict[str, Future] = {}
+
+    # ---------- Session / worker lifecycle ----------
+    def _make_session(self) -> requests.Session:
+        s = requests.Session()
+        adapter = HTTPAdapter(pool_connections=IO_WORKERS * 2, pool_maxsize=IO_WORKERS * 2)
+        s.mount("http://", adapter)
+        s.mount("https://", adapter)
+        return s
+
+    def destroy(self):
+        self._io.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     # ---------- File loading ----------
     def load_table(self):
         path = filedialog.askopenfilename(
@@ -94,14 +152,15 @@ class ListingsViewer(tk.Tk):
         if not path:
             return
 
+        # Peek at the header only, so we can load just the columns we display
         try:
-            df = self._read_any_table(path)
+            header = self._read_any_table(path, nrows=0)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open file:\n{e}")
             return
 
         # Normalize/locate columns (case-insensitive)
-        cols_map = {c.strip().lower(): c for c in df.columns if isinstance(c, str)}
+        cols_map = {c.strip().lower(): c for c in header.columns if isinstance(c, str)}
         def col(name): return cols_map.get(name)
 
         image_col = col("image_url") or col("image") or col("image link")
@@ -113,35 +172,49 @@ class ListingsViewer(tk.Tk):
             messagebox.showerror("Missing column", "Could not find an 'image_url' column.")
             return
 
-        rows: list[ListingRow] = []
-        for _, r in df.iterrows():
-            # Prefer title_en if it is plain text (not a formula that starts with '=')
-            t_en = r.get(title_en_col) if title_en_col else None
-            t = r.get(title_col) if title_col else None
-
-            title = ""
-            if isinstance(t_en, str) and t_en.strip() and not t_en.strip().startswith("="):
-                title = t_en.strip()
-            elif isinstance(t, str) and t.strip():
-                title = t.strip()
-            elif isinstance(t_en, (int, float)):
-                title = str(t_en)
-            elif isinstance(t, (int, float)):
-                title = str(t)
-
-            image_url = r.get(image_col)
-            if isinstance(image_url, str):
-                image_url = image_url.strip().strip('"').strip("'")
-            else:
-                image_url = None
-
-            detail_url = r.get(detail_col) if detail_col else None
-            if isinstance(detail_url, str):
-                detail_url = detail_url.strip()
-            else:
-                detail_url = None
-
-            rows.append(ListingRow(title=title or "(no title)", image_url=image_url, detail_url=detail_url))
+        usecols = list(dict.fromkeys(c for c in (image_col, title_en_col, title_col, detail_col) if c))
+        # Title columns keep their source types: is_text() below needs to tell text from numbers
+        dtype = {c: "string" for c in (image_col, detail_col) if c and c not in (title_en_col, title_col)}
+        try:
+            df = self._read_any_table(path, usecols=usecols, dtype=dtype)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open file:\n{e}")
+            return
+
+        def text(name) -> pd.Series:
+            # Stripped string column; empty cells (or a missing column) become <NA>
+            if not name:
+                return pd.Series(pd.NA, index=df.index, dtype="string")
+            return df[name].astype("string").str.strip().replace("", pd.NA)
+
+        def is_text(name) -> pd.Series:
+            # Cells that were text in the file (numbers, e.g. a formula's cached 0, are not)
+            if not name:
+                return pd.Series(False, index=df.index)
+            return df[name].map(lambda v: isinstance(v, str)).astype(bool)
+
+        def optional(s: pd.Series) -> pd.Series:
+            return s.astype(object).where(s.notna(), None)
+
+        # Prefer title_en if it is plain text (not a formula that starts with '='), then text title.
+        # Numbers only count when neither is text: xlsxwriter formula cells read back as 0.
+        titles_en, titles_src = text(title_en_col), text(title_col)
+        en_text, src_text = is_text(title_en_col), is_text(title_col)
+        titles = (
+            titles_en.where(en_text & ~titles_en.str.startswith("=", na=False))
+            .fillna(titles_src.where(src_text))
+            .fillna(titles_en.where(~en_text))
+            .fillna(titles_src.where(~src_text))
+            .fillna("(no title)")
+        )
+
+        image_urls = text(image_col).str.strip('"').str.strip("'")
+        detail_urls = text(detail_col)
+
+        rows: list[ListingRow] = [
+            ListingRow(title=t, image_url=u, detail_url=d)
+            for t, u, d in zip(titles, optional(image_urls), optional(detail_urls))
+        ]
 
         self.rows = rows
         self.idx = 0 if self.rows else -1
@@ -150,17 +223,23 @@ class ListingsViewer(tk.Tk):
         self.update_controls()
         self.show_current()
 
-    def _read_any_table(self, path: str) -> pd.DataFrame:
+    def _read_any_table(self, path: str, **read_kwargs) -> pd.DataFrame:
+        """Read a CSV or Excel file; extra kwargs (nrows, usecols, dtype, ...) go to pandas."""
         ext = os.path.splitext(path)[1].lower()
         if ext == ".csv":
             # Try to auto-detect delimiter; BOM-safe; skip bad lines if any.
             try:
-                return pd.read_csv(path, engine="python", sep=None, encoding="utf-8-sig", on_bad_lines="skip")
+                return pd.read_csv(path, engine="python", sep=None, encoding="utf-8-sig",
+                                   on_bad_lines="skip", **read_kwargs)
             except Exception:
-                return pd.read_csv(path, encoding="utf-8", on_bad_lines="skip")
+                return pd.read_csv(path, encoding="utf-8", on_bad_lines="skip", **read_kwargs)
         else:
-            # Excel
-            return pd.read_excel(path, engine="openpyxl")
+            # Excel: Rust-based calamine is much faster (pandas >= 2.2 + python-calamine);
+            # fall back to openpyxl if it isn't available.
+            try:
+                return pd.read_excel(path, engine="calamine", **read_kwargs)
+            except Exception:
+                return pd.read_excel(path, engine="openpyxl", **read_kwargs)
 
     # ---------- Navigation ----------
     def prev_row(self):
@@ -191,35 +270,111 @@ class ListingsViewer(tk.Tk):
         row = self.rows[self.idx]
         self.title_label.config(text=row.title)
 
-        # Fetch/resize image
+        # Cached image, or kick off a background download and show a placeholder
         photo = self.fetch_image(row.image_url)
-        if photo is None:
-            self.image_panel.config(image="", text="(no image)", font=("Segoe UI", 12))
-        else:
+        if photo is not None:
             self.image_panel.config(image=photo, text="")
+        elif row.image_url:
+            self.image_panel.config(image="", text="(loading image…)", font=("Segoe UI", 12))
+        else:
+            self.image_panel.config(image="", text="(no image)", font=("Segoe UI", 12))
         self.current_photo = photo  # keep reference to prevent GC
 
+        # Warm the cache for the next few rows
+        for j in range(self.idx + 1, min(self.idx + 1 + PREFETCH_AHEAD, len(self.rows))):
+            self.fetch_image(self.rows[j].image_url)
+
         self.status_label.config(text=f"Row {self.idx + 1} of {len(self.rows)}")
         self.update_controls()
 
     def fetch_image(self, url: Optional[str]) -> Optional[ImageTk.PhotoImage]:
+        """Return the cached PhotoImage for url, or schedule a background load and return None."""
         if not url:
             return None
         if url in self.image_cache:
+            self.image_cache.move_to_end(url)
             return self.image_cache[url]
-        try:
-            resp = requests.get(url, timeout=20)
+        if url not in self._pending:
+            fut = self._io.submit(self._download_and_decode, url, self._bytes_cache.get(url))
+            self._pending[url] = fut
+            fut.add_done_callback(lambda f, u=url: self._on_image_done(u, f))
+        return None
+
+    def _download_and_decode(self, url: str, blob: Optional[bytes]) -> Tuple[Image.Image, Optional[bytes]]:
+        # Runs on a worker thread: no Tk calls (or in-memory cache mutation) in here
+        cache_path = self._disk_cache_path(url)
+        if cache_path.exists():
+            try:
+                img = Image.open(cache_path)
+                img.load()
+                return img, None
+            except OSError:
+                pass  # unreadable entry: rebuild it below
+
+        if blob is None:
+            resp = self.session.get(url, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
-            img = Image.open(io.BytesIO(resp.content)).convert("RGB")
+            blob = resp.content
+        img = _fit_to_display(Image.open(io.BytesIO(blob)))
+
+        # Save the finished thumbnail (write-then-rename so readers never see a partial file)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            img.save(tmp_path, format="PNG")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            return img, blob  # cache is best-effort; keep the bytes in memory instead
+        # The disk copy is checked first next time, so there's no point holding the bytes too
+        return img, None
+
+    @staticmethod
+    def _disk_cache_path(url: str) -> Path:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return DISK_CACHE_DIR / key[:2] / f"{key[2:]}.png"
+
+    def _on_image_done(self, url: str, fut: Future):
+        # Hop back onto the Tk thread to build the PhotoImage
+        try:
+            self.after(0, self._install_image, url, fut)
+        except (RuntimeError, tk.TclError):
+            pass  # window already closed
+
+    def _install_image(self, url: str, fut: Future):
+        self._pending.pop(url, None)
+        if fut.cancelled():
+            return
+        is_current = 0 <= self.idx < len(self.rows) and self.rows[self.idx].image_url == url
+        try:
+            img, blob = fut.result()
         except Exception as e:
-            self.image_panel.config(text=f"(image load failed)\n{e}", image="")
-            return None
+            if is_current:
+                self.image_panel.config(text=f"(image load failed)\n{e}", image="")
+            return
 
-        # Fit within MAX_W x MAX_H while preserving aspect
-        img.thumbnail((MAX_W, MAX_H), Image.LANCZOS)
         tk_img = ImageTk.PhotoImage(img)
+        self._cache_image(url, tk_img, blob)
+        if is_current:
+            self.current_photo = tk_img
+            self.image_panel.config(image=tk_img, text="")
+
+    def _cache_image(self, url: str, tk_img: ImageTk.PhotoImage, blob: Optional[bytes]):
         self.image_cache[url] = tk_img
-        return tk_img
+        self.image_cache.move_to_end(url)
+        while len(self.image_cache) > IMAGE_CACHE_MAX:
+            # Drop our Tk reference; current_photo still pins whatever is on screen
+            _, evicted = self.image_cache.popitem(last=False)
+            del evicted
+
+        if blob is None:
+            return  # the thumbnail is on disk; nothing to keep in memory
+        if url not in self._bytes_cache:
+            self._bytes_cache[url] = blob
+            self._bytes_cache_size += len(blob)
+        self._bytes_cache.move_to_end(url)
+        while self._bytes_cache_size > BYTES_CACHE_MAX and len(self._bytes_cache) > 1:
+            _, old = self._bytes_cache.popitem(last=False)
+            self._bytes_cache_size -= len(old)
 
     # ---------- Actions ----------
     def open_link(self):
@@ -243,6 +398,6 @@ if __name__ == "__main__":
     except ImportError as e:
         sys.stderr.write(
             f"Missing dependency: {e}\n"
-            "Install with: pip install pillow pandas openpyxl requests\n"
+            "Install with: pip install pillow pandas openpyxl requests (optional: python-calamine)\n"
         )
         raise
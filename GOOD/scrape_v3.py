@@ -1,41 +1,96 @@
 #!/usr/bin/env python3
+import codecs
 import csv
 import re
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, urlsplit, urlunsplit
+from urllib.parse import urlparse, parse_qs, urlencode, urljoin, urlsplit, urlunsplit, unquote_plus
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lxml_html
+
+# Optional: compact Bloom-filter dedupe for long crawls (pip install pybloom-live)
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+# Optional: HTTP/2 client that multiplexes concurrent page fetches over one connection
+# (pip install "httpx[http2]"); requests is used otherwise.
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:
+    httpx = None
+
+# Optional: pyarrow's C++ CSV writer for the output file (pip install pyarrow)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+HTTP_ERRORS: tuple[type[Exception], ...] = (requests.HTTPError,)
+if httpx is not None:
+    HTTP_ERRORS += (httpx.HTTPStatusError,)
 
 
 # === ONE PLACE to control thumbnail size (pixels) ===
 IMG_PX = 160  # used in =IMAGE(...,3,IMG_PX,IMG_PX) and for row/column sizing
 
+CSV_BATCH_ROWS = 10_000  # rows buffered between pyarrow CSV writes
+
+
+def _cls(name: str) -> str:
+    # XPath equivalent of the CSS class selector ".name" (whole-token match)
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPaths used by scrape_page, compiled once at import (mirror the site's CSS structure)
+_X_BLOCKS = etree.XPath(f"//div[{_cls('list_item_block')}]")
+_X_TITLE = etree.XPath(f".//*[{_cls('products-txt')}]//a[{_cls('translate')}]//h4")
+_X_PRICE = etree.XPath(
+    f".//*[{_cls('short-price')}]//*[{_cls('current_price')} or {_cls('current_listing_price')}]//strong"
+)
+_X_BUYOUT = etree.XPath(f".//*[{_cls('short-price')}]//*[{_cls('buy_now_price')}]//strong")
+_X_HREF = etree.XPath(f".//*[{_cls('products-txt')}]//a[{_cls('translate')}]/@href")
+_X_IMG_SRC = etree.XPath(f".//*[{_cls('products-pic')}]//img/@src")
+
+_CHARSET_RE = re.compile(r"charset=([\w-]+)", re.I)
+
+# Fast paths for the only query params we touch per page / per listing
+_PAGE_RE = re.compile(r"([?&])page=[^&#]*")
+_ID_RE = re.compile(r"[?&]id=([^&#]*)")
+_NON_DIGIT_RE = re.compile(r"\D+")
+
 
 def set_page_param(url: str, page: int) -> str:
-    parts = list(urlparse(url))
-    qs = parse_qs(parts[4])
-    qs["page"] = [str(page)]
-    parts[4] = urlencode(qs, doseq=True)
-    return urlunparse(parts)
+    new_url, n = _PAGE_RE.subn(rf"\g<1>page={page}", url, count=1)
+    if n:
+        return new_url
+    # No page= yet: append it (before any #fragment)
+    base, hash_sep, fragment = url.partition("#")
+    joiner = "" if base.endswith(("?", "&")) else ("&" if "?" in base else "?")
+    return f"{base}{joiner}page={page}{hash_sep}{fragment}"
 
 
 def extract_item_id(href: str) -> str | None:
     if not href:
         return None
-    try:
-        q = parse_qs(urlparse(href).query)
-        return q.get("id", [None])[0]
-    except Exception:
-        return None
+    m = _ID_RE.search(href)
+    return unquote_plus(m.group(1)) if m and m.group(1) else None
 
 
 def clean_price(text: str) -> int | None:
     if not text:
         return None
-    digits = re.sub(r"[^\d]", "", text)
-    return int(digits) if digits.isdigit() else None
+    # Everything left after dropping non-digits is a valid int() literal
+    digits = _NON_DIGIT_RE.sub("", text)
+    return int(digits) if digits else None
 
 
 def normalize_detail_url(u: str | None) -> str | None:
@@ -52,38 +107,75 @@ def normalize_detail_url(u: str | None) -> str | None:
     return urlunsplit((s.scheme, s.netloc, s.path, q_str, ""))
 
 
-def scrape_page(session: requests.Session, page_url: str) -> list[dict]:
+def _first_text(nodes: list) -> str | None:
+    # Like BeautifulSoup's get_text(strip=True) on the first match
+    return "".join(t.strip() for t in nodes[0].itertext()) if nodes else None
+
+
+def _first_attr(values: list) -> str | None:
+    return str(values[0]) if values else None
+
+
+def make_client(headers: dict[str, str], workers: int):
+    """
+    Thread-safe HTTP client shared by all page workers: an HTTP/2 httpx.Client when
+    available, else a requests.Session with one pooled connection per worker.
+    Both expose the same .get()/.raise_for_status()/.headers/.content used below.
+    """
+    if httpx is not None:
+        limits = httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+        return httpx.Client(http2=True, limits=limits, headers=headers, follow_redirects=True)
+
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _join_url(page_url: str, base_prefix: str, ref: str) -> str:
+    # Fast paths for absolute and site-relative refs; urljoin handles everything else
+    if ref.startswith(("http://", "https://")):
+        return ref
+    if ref.startswith("/") and not ref.startswith("//") and "/." not in ref:
+        return base_prefix + ref
+    return urljoin(page_url, ref)
+
+
+def scrape_page(session, page_url: str) -> list[dict]:
     resp = session.get(page_url, timeout=20)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Parse the raw bytes with the server's charset (the site serves UTF-8)
+    m = _CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    parser = lxml_html.HTMLParser(encoding=m.group(1) if m else "utf-8")
+    try:
+        tree = lxml_html.fromstring(resp.content, parser=parser)
+    except etree.ParserError:
+        return []  # empty/blank body ("Document is empty"): a page with no items
+
+    # page_url is fixed for the whole page: split it once for the href/src joins below
+    base = urlsplit(page_url)
+    base_prefix = f"{base.scheme}://{base.netloc}"
 
     items = []
-    for block in soup.select("div.list_item_block"):
+    for block in _X_BLOCKS(tree):
         # Title
-        title_tag = block.select_one(".products-txt a.translate h4")
-        title = title_tag.get_text(strip=True) if title_tag else None
+        title = _first_text(_X_TITLE(block))
 
         # Auction price (may be shown as current_price OR current_listing_price)
-        price_tag = block.select_one(
-            ".short-price .current_price strong, .short-price .current_listing_price strong"
-        )
-        price_text = price_tag.get_text(strip=True) if price_tag else None
-        price_jpy = clean_price(price_text)
+        price_jpy = clean_price(_first_text(_X_PRICE(block)))
 
         # Buyout price
-        buyout_tag = block.select_one(".short-price .buy_now_price strong")
-        buyout_text = buyout_tag.get_text(strip=True) if buyout_tag else None
-        buyout_jpy = clean_price(buyout_text)
+        buyout_jpy = clean_price(_first_text(_X_BUYOUT(block)))
 
         # Detail URL
-        a = block.select_one(".products-txt a.translate")
-        rel_href = a.get("href") if a else None
-        detail_url = urljoin(page_url, rel_href) if rel_href else None
+        rel_href = _first_attr(_X_HREF(block))
+        detail_url = _join_url(page_url, base_prefix, rel_href) if rel_href else None
 
         # Image URL
-        img = block.select_one(".products-pic img")
-        img_src = img.get("src").strip() if img and img.get("src") else None
-        image_url = urljoin(page_url, img_src) if img_src else None
+        img_src = (_first_attr(_X_IMG_SRC(block)) or "").strip() or None
+        image_url = _join_url(page_url, base_prefix, img_src) if img_src else None
 
         # Item ID
         item_id = extract_item_id(rel_href)
@@ -104,6 +196,54 @@ def scrape_page(session: requests.Session, page_url: str) -> list[dict]:
     return items
 
 
+class ArrowCsvWriter:
+    """
+    Stand-in for csv.DictWriter that buffers rows column-wise and writes them with
+    pyarrow every `batch_rows` rows. Use as a context manager so the tail gets flushed.
+    """
+
+    def __init__(self, f, fieldnames: list[str], batch_rows: int = CSV_BATCH_ROWS):
+        # Write to the binary layer under the text file; emit the utf-8-sig BOM ourselves
+        f.flush()
+        self.out = f.buffer
+        self.out.write(codecs.BOM_UTF8)
+        self.fieldnames = fieldnames
+        self.batch_rows = batch_rows
+        self.columns: dict[str, list] = {k: [] for k in fieldnames}
+        self.buffered = 0
+
+    def writeheader(self):
+        self.out.write((",".join(self.fieldnames) + "\n").encode("utf-8"))
+
+    def writerows(self, rows: list[dict]):
+        for key, values in self.columns.items():
+            values.extend(row.get(key) for row in rows)
+        self.buffered += len(rows)
+        if self.buffered >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.buffered:
+            return
+        table = pa.table(self.columns)
+        pa_csv.write_csv(table, self.out, write_options=pa_csv.WriteOptions(include_header=False))
+        self.columns = {k: [] for k in self.fieldnames}
+        self.buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+
+def make_csv_writer(f, fieldnames: list[str]):
+    """DictWriter-style writer for the output CSV, wrapped as a context manager."""
+    if pa is not None:
+        return ArrowCsvWriter(f, fieldnames)
+    return nullcontext(csv.DictWriter(f, fieldnames=fieldnames))
+
+
 def pixels_to_points(px: int | float) -> float:
     # Excel row height is in points; 1 px ≈ 0.75 pt at 96dpi
     return float(px) * 0.75
@@ -115,7 +255,7 @@ def pixels_to_col_width(px: int | float) -> float:
 
 
 def main(start_url: str, pages: int | None, out_csv: str, delay_sec: float = 1.0,
-         until_empty: bool = False, out_xlsx: str | None = None):
+         until_empty: bool = False, out_xlsx: str | None = None, workers: int = 4):
     out_path = Path(out_csv)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -123,8 +263,8 @@ def main(start_url: str, pages: int | None, out_csv: str, delay_sec: float = 1.0
         "User-Agent": "Mozilla/5.0 (compatible; listings-bot/1.0; +https://example.org/bot)",
         "Accept-Language": "en-US,en;q=0.9",
     }
-    session = requests.Session()
-    session.headers.update(headers)
+    workers = max(1, workers)
+    session = make_client(headers, workers)
 
     # Keep title as column B; include an image preview and translation formula.
     fieldnames = [
@@ -139,6 +279,11 @@ def main(start_url: str, pages: int | None, out_csv: str, delay_sec: float = 1.0
         "title_en",     # I =TRANSLATE(Bn,"ja","en")
     ]
 
+    # ---- Your exact image formula size (IMG_PX x IMG_PX) and translate formula ----
+    # Only the row number varies, so build the templates once.
+    image_formula = f'=IF(LEN(F{{r}}),IMAGE(F{{r}},"",3,{IMG_PX},{IMG_PX}),"")'
+    translate_formula = '=TRANSLATE(B{r},"ja","en")'
+
     # Derive starting page from the start_url
     try:
         qs = parse_qs(urlparse(start_url).query)
@@ -154,11 +299,11 @@ def main(start_url: str, pages: int | None, out_csv: str, delay_sec: float = 1.0
         except ImportError:
             raise SystemExit("Please install xlsxwriter: pip install xlsxwriter")
 
-        workbook = xlsxwriter.Workbook(out_xlsx)
+        # constant_memory flushes each row to disk as soon as the next one starts,
+        # so memory stays flat however many pages we scrape. Rows must be written
+        # strictly in order, so all sizing happens before the header is written.
+        workbook = xlsxwriter.Workbook(out_xlsx, {"constant_memory": True})
         worksheet = workbook.add_worksheet("Listings")
-        # Write headers
-        for c, h in enumerate(fieldnames):
-            worksheet.write(0, c, h)
         # Nice column widths
         worksheet.set_column(0, 0, 12)   # item_id
         worksheet.set_column(1, 1, 60)   # title
@@ -167,28 +312,53 @@ def main(start_url: str, pages: int | None, out_csv: str, delay_sec: float = 1.0
         worksheet.set_column(6, 6, pixels_to_col_width(IMG_PX))  # image_preview column sized to image width
         worksheet.set_column(7, 7, 30)   # source_page
         worksheet.set_column(8, 8, 36)   # title_en
+        # Every data row is sized to fit IMG_PX; keep the header row at Excel's default height
+        worksheet.set_default_row(pixels_to_points(IMG_PX))
+        worksheet.set_row(0, 15)
+        # Write headers
+        worksheet.write_row(0, 0, fieldnames)
 
     # === DEDUPING STATE ===
-    seen_item_ids: set[str] = set()
-    seen_detail_urls: set[str] = set()
+    # Keys are "i:<item_id>" or "u:<normalized detail_url>". The scalable Bloom filter keeps
+    # memory flat on long crawls (~1 spurious skip per million items); plain set without it.
+    if ScalableBloomFilter is not None:
+        seen = ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-6)
+    else:
+        seen = set()
+
+    last_page = start_page + pages - 1 if pages is not None else None
 
     # Write CSV (formulas included)
-    with out_path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    with out_path.open("w", newline="", encoding="utf-8-sig") as f, \
+            make_csv_writer(f, fieldnames) as writer, \
+            ThreadPoolExecutor(max_workers=workers) as executor:
         writer.writeheader()
 
-        page = start_page
         total_written = 0
         excel_row = 2   # first data row (row 1 is header)
         xlsx_row0 = 1   # first data row in xlsxwriter (0-based)
 
+        # Sliding window of in-flight pages: (page, future), drained in page order
+        pending: deque = deque()
+        next_page = start_page
+
         while True:
-            page_url = set_page_param(start_url, page)
-            print(f"Fetching page {page}: {page_url}")
+            # Keep up to `workers` pages fetching in the background
+            while len(pending) < workers and (last_page is None or next_page <= last_page):
+                if pending:
+                    time.sleep(delay_sec / workers)
+                page_url = set_page_param(start_url, next_page)
+                print(f"Fetching page {next_page}: {page_url}")
+                pending.append((next_page, executor.submit(scrape_page, session, page_url)))
+                next_page += 1
+
+            if not pending:
+                break
+            page, future = pending.popleft()
 
             try:
-                items = scrape_page(session, page_url)
-            except requests.HTTPError as e:
+                items = future.result()
+            except HTTP_ERRORS as e:
                 print(f"[!] HTTP error on page {page}: {e}")
                 break
             except Exception as e:
@@ -200,70 +370,51 @@ def main(start_url: str, pages: int | None, out_csv: str, delay_sec: float = 1.0
                 if until_empty:
                     break
 
-            page_written = 0
+            page_rows: list[dict] = []
             page_skipped = 0
 
             for row in items:
-                # Build dedupe keys
+                # Build dedupe key (item_id preferred, normalized URL as fallback)
                 iid = (row.get("item_id") or "").strip() or None
-                norm_url = normalize_detail_url(row.get("detail_url"))
-
-                # Decide if we've seen this already
-                duplicate = False
-                if iid and iid in seen_item_ids:
-                    duplicate = True
-                elif not iid and norm_url and norm_url in seen_detail_urls:
-                    duplicate = True
+                if iid:
+                    key = f"i:{iid}"
+                else:
+                    norm_url = normalize_detail_url(row.get("detail_url"))
+                    key = f"u:{norm_url}" if norm_url else None
+
+                # Skip if we've seen this already, otherwise mark as seen
+                if key is not None:
+                    if key in seen:
+                        page_skipped += 1
+                        continue
+                    seen.add(key)
+
+                # Formulas are written once here and shared by the CSV and XLSX writers
+                row["image_preview"] = image_formula.format(r=excel_row)
+                row["title_en"] = translate_formula.format(r=excel_row)
+
+                page_rows.append(row)
+                excel_row += 1
 
-                if duplicate:
-                    page_skipped += 1
-                    continue
+            # CSV: one batched write per page (buffered further when pyarrow is in use)
+            writer.writerows(page_rows)
 
-                # Mark as seen
-                if iid:
-                    seen_item_ids.add(iid)
-                elif norm_url:
-                    seen_detail_urls.add(norm_url)
-
-                # ---- Your exact image formula size (160x160) and translate formula ----
-                row["image_preview"] = f'=IF(LEN(F{excel_row}),IMAGE(F{excel_row},"",3,{IMG_PX},{IMG_PX}),"")'
-                row["title_en"] = f'=TRANSLATE(B{excel_row},"ja","en")'
-
-                # CSV
-                writer.writerow(row)
-
-                # XLSX (pre-sized rows)
-                if worksheet is not None:
-                    for c, key in enumerate(fieldnames):
-                        if key == "image_preview":
-                            worksheet.write_formula(
-                                xlsx_row0, c,
-                                f'=IF(LEN(F{xlsx_row0+1}),IMAGE(F{xlsx_row0+1},"",3,{IMG_PX},{IMG_PX}),"")'
-                            )
-                        elif key == "title_en":
-                            worksheet.write_formula(
-                                xlsx_row0, c,
-                                f'=TRANSLATE(B{xlsx_row0+1},"ja","en")'
-                            )
-                        else:
-                            worksheet.write(xlsx_row0, c, row.get(key))
-
-                    # Set row height to fit IMG_PX
-                    worksheet.set_row(xlsx_row0, pixels_to_points(IMG_PX))
+            # XLSX (row heights come from set_default_row; write() turns "=..." into formulas)
+            if worksheet is not None:
+                for row in page_rows:
+                    worksheet.write_row(xlsx_row0, 0, [row.get(key) for key in fieldnames])
+                    xlsx_row0 += 1
 
-                excel_row += 1
-                xlsx_row0 += 1
-                total_written += 1
-                page_written += 1
+            page_written = len(page_rows)
+            total_written += page_written
 
             print(f"[+] Page {page}: wrote {page_written} new items, skipped {page_skipped} duplicates (total {total_written})")
 
-            # Stop conditions
-            if pages is not None and page >= start_page + pages - 1:
-                break
-            page += 1
-            time.sleep(delay_sec)
+        # Don't start pages we no longer need
+        for _, future in pending:
+            future.cancel()
 
+    session.close()
     if workbook is not None:
         workbook.close()
 
@@ -279,6 +430,7 @@ if __name__ == "__main__":
     ap.add_argument("--out", default="listings.csv", help="Output CSV filename.")
     ap.add_argument("--out-xlsx", default=None, help="Also write an Excel .xlsx with pre-sized rows.")
     ap.add_argument("--delay", type=float, default=1.0, help="Seconds to sleep between pages.")
+    ap.add_argument("--workers", type=int, default=4, help="Pages to fetch in parallel.")
     args = ap.parse_args()
 
     main(
@@ -288,4 +440,5 @@ if __name__ == "__main__":
         delay_sec=args.delay,
         until_empty=args.until_empty,
         out_xlsx=args.out_xlsx,
+        workers=args.workers,
     )
@@ -6,19 +6,26 @@ Listings Viewer (Excel or CSV)
 """
 
 import io
+import csv
 import sys
 import os
+import asyncio
+import hashlib
+import threading
 import webbrowser
+from pathlib import Path
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Optional, Dict, List, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Tuple, Union
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 import pandas as pd
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, features as pil_features
+import PIL
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
@@ -29,6 +36,107 @@ MAX_H = 640
 # Parallelism & networking
 MAX_WORKERS = 6
 REQUEST_TIMEOUT = (5, 20)  # (connect, read) seconds
+RETRY_TOTAL = 2            # retries for transient failures (requests and httpx paths alike)
+RETRY_BACKOFF = 0.3        # seconds, doubled per retry
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+ASYNC_CONCURRENCY = 64     # in-flight image GETs when httpx is available
+DECODE_WORKERS = os.cpu_count() or 4  # processes for JPEG decode + resize
+
+# How often the preload dialog picks up finished images (~one frame)
+FLUSH_MS = 16
+
+# Images kept in memory; older ones are re-read from the disk cache when shown again
+IMAGE_CACHE_MAX = 256
+
+# Resized thumbnails persist here across runs, so re-opening an export skips the network
+CACHE_DIR = Path.home() / ".cache" / "listings_viewer"
+
+# Optional async downloads (pip install "httpx[http2]"): many concurrent GETs
+# multiplexed over one or two HTTP/2 connections instead of MAX_WORKERS sockets.
+_HAS_HTTPX = False
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+    _HAS_HTTPX = True
+except Exception:
+    _HAS_HTTPX = False
+
+# Brotli responses can only be requested when something can decode them
+# (both requests/urllib3 and httpx pick up the brotli package automatically).
+_HAS_BROTLI = False
+try:
+    import brotli  # noqa: F401
+    _HAS_BROTLI = True
+except Exception:
+    _HAS_BROTLI = False
+
+
+RawImage = Tuple[str, Tuple[int, int], bytes]  # (mode, size, pixel bytes)
+
+
+def cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.webp"
+
+
+def decode_resize(blob: bytes, save_to: Optional[Path] = None, size: Tuple[int, int] = (MAX_W, MAX_H)) -> RawImage:
+    """Decode image bytes and fit them within size (w, h), optionally caching the result.
+
+    Fresh downloads run it in a worker process, so it returns raw pixels (cheap to pickle,
+    unlike re-encoding to PNG) for _image_from_raw() to rebuild in the parent.
+    Cached thumbnails go through here too, in-process; usually they already fit, so it's just a decode.
+    """
+    img = Image.open(io.BytesIO(blob))
+    # Let libjpeg decode at 1/2, 1/4 or 1/8 scale; the residual resize is then <= 2x,
+    # where BILINEAR looks the same as LANCZOS at a fraction of the cost
+    img.draft("RGB", (size[0] * 2, size[1] * 2))
+    if img.mode != "RGB":  # JPEGs usually decode straight to RGB; convert() would just copy
+        img = img.convert("RGB")
+    img.thumbnail(size, Image.BILINEAR)
+
+    if save_to is not None:
+        # method=0 is libwebp's fastest encoder; write-then-rename so readers never see half a file
+        try:
+            save_to.parent.mkdir(parents=True, exist_ok=True)
+            tmp = save_to.with_suffix(".tmp")
+            img.save(tmp, format="WEBP", quality=85, method=0)
+            os.replace(tmp, save_to)
+        except Exception:
+            pass  # cache is best-effort
+    return img.mode, img.size, img.tobytes()
+
+
+def _image_from_raw(raw: RawImage) -> Image.Image:
+    mode, size, data = raw
+    return Image.frombytes(mode, size, data)
+
+
+def _post_decoded(post, url: str, fut: Future):
+    # Done-callback for a decode future: report the rebuilt Image (or the error)
+    try:
+        post(url, _image_from_raw(fut.result()), None)
+    except Exception as e:
+        post(url, None, str(e))
+
+
+class LRU(OrderedDict):
+    """Dict that drops its least-recently-used entries beyond maxsize.
+
+    Callers mark a hit with move_to_end(); plain lookups don't reorder.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Column names load_table looks for (matched case-insensitively)
+CANONICAL = ("image_url", "image", "image link", "title_en", "title", "detail_url")
 
 
 @dataclass
@@ -86,8 +194,12 @@ class ListingsViewer(tk.Tk):
         self.rows: List[ListingRow] = []
         self.idx: int = -1
 
-        # Cache: url -> PhotoImage (ALL images are loaded here during preload)
-        self.image_cache: Dict[str, ImageTk.PhotoImage] = {}
+        # Cache: url -> PIL Image from preload, swapped for its PhotoImage the first time it's shown
+        # (bounded; evictions fall back to the disk cache)
+        self.image_cache: "LRU[str, Union[Image.Image, ImageTk.PhotoImage]]" = LRU(IMAGE_CACHE_MAX)
+        self._thumb_size: Tuple[int, int] = (MAX_W, MAX_H)
+        self._refetching: set = set()  # evicted URLs being downloaded again
+        self._refetched: "deque[Tuple[str, Optional[Image.Image], Optional[str]]]" = deque()
         self.current_photo: Optional[ImageTk.PhotoImage] = None
 
         # Networking: pooled session with retries
@@ -97,17 +209,20 @@ class ListingsViewer(tk.Tk):
     def _make_session(self) -> requests.Session:
         s = requests.Session()
         retry = Retry(
-            total=2,
-            backoff_factor=0.3,
-            status_forcelist=(429, 500, 502, 503, 504),
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
             allowed_methods=("GET",)
         )
+        # Serves the MAX_WORKERS-thread fallback (and the odd refetch); httpx has its own pool
         adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retry)
         s.mount("http://", adapter)
         s.mount("https://", adapter)
         s.headers.update({
             "User-Agent": "ListingsViewer/1.0 (+GUI)",
             "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+            "Accept-Encoding": "gzip, br" if _HAS_BROTLI else "gzip",
+            "Connection": "keep-alive",
         })
         return s
 
@@ -132,46 +247,51 @@ class ListingsViewer(tk.Tk):
 
         # Normalize/locate columns (case-insensitive)
         cols_map = {c.strip().lower(): c for c in df.columns if isinstance(c, str)}
-        def col(name): return cols_map.get(name)
+        found = {k: cols_map.get(k) for k in CANONICAL}
 
-        image_col = col("image_url") or col("image") or col("image link")
-        title_en_col = col("title_en")
-        title_col = col("title")
-        detail_col = col("detail_url")
+        image_col = found["image_url"] or found["image"] or found["image link"]
+        title_en_col = found["title_en"]
+        title_col = found["title"]
+        detail_col = found["detail_url"]
 
         if not image_col:
             messagebox.showerror("Missing column", "Could not find an 'image_url' column.")
             return
 
-        rows: List[ListingRow] = []
-        for _, r in df.iterrows():
-            # Prefer title_en if it's plain text; else fallback to title.
-            t_en = r.get(title_en_col) if title_en_col else None
-            t = r.get(title_col) if title_col else None
-
-            title = ""
-            if isinstance(t_en, str) and t_en.strip() and not t_en.strip().startswith("="):
-                title = t_en.strip()
-            elif isinstance(t, str) and t.strip():
-                title = t.strip()
-            elif isinstance(t_en, (int, float)):
-                title = str(t_en)
-            elif isinstance(t, (int, float)):
-                title = str(t)
-
-            image_url = r.get(image_col)
-            if isinstance(image_url, str):
-                image_url = image_url.strip().strip('"').strip("'")
-            else:
-                image_url = None
+        def text(name) -> pd.Series:
+            # Stripped string column; empty cells (or a missing column) become <NA>
+            if not name:
+                return pd.Series(pd.NA, index=df.index, dtype="string")
+            return df[name].astype("string").str.strip().replace("", pd.NA)
+
+        def is_text(name) -> pd.Series:
+            # Cells that were text in the file (numbers, e.g. a formula's cached 0, are not)
+            if not name:
+                return pd.Series(False, index=df.index)
+            return df[name].map(lambda v: isinstance(v, str)).astype(bool)
+
+        def optional(s: pd.Series) -> pd.Series:
+            return s.astype(object).where(s.notna(), None)
+
+        # Prefer title_en if it's plain text; else fallback to title.
+        # Numbers only count when neither is text: xlsxwriter formula cells read back as 0.
+        titles_en, titles_src = text(title_en_col), text(title_col)
+        en_text, src_text = is_text(title_en_col), is_text(title_col)
+        titles = (
+            titles_en.where(en_text & ~titles_en.str.startswith("=", na=False))
+            .fillna(titles_src.where(src_text))
+            .fillna(titles_en.where(~en_text))
+            .fillna(titles_src.where(~src_text))
+            .fillna("(no title)")
+        )
 
-            detail_url = r.get(detail_col) if detail_col else None
-            if isinstance(detail_url, str):
-                detail_url = detail_url.strip()
-            else:
-                detail_url = None
+        image_urls = text(image_col).str.strip('"').str.strip("'")
+        detail_urls = text(detail_col)
 
-            rows.append(ListingRow(title=title or "(no title)", image_url=image_url, detail_url=detail_url))
+        rows: List[ListingRow] = [
+            ListingRow(title=t, image_url=u, detail_url=d)
+            for t, u, d in zip(titles, optional(image_urls), optional(detail_urls))
+        ]
 
         self.rows = rows
         self.idx = 0 if self.rows else -1
@@ -189,16 +309,38 @@ class ListingsViewer(tk.Tk):
     def _read_any_table(self, path: str) -> pd.DataFrame:
         ext = os.path.splitext(path)[1].lower()
         if ext == ".csv":
+            # Fast path: pyarrow's multithreaded parser. It can't auto-detect the
+            # delimiter, so sniff it once from the first 4 KB.
+            try:
+                return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow",
+                                   sep=self._sniff_sep(path), encoding="utf-8-sig")
+            except Exception:
+                pass
+            # Try to auto-detect delimiter; BOM-safe; skip bad lines if any.
             try:
                 return pd.read_csv(path, engine="python", sep=None, encoding="utf-8-sig", on_bad_lines="skip")
             except Exception:
                 return pd.read_csv(path, encoding="utf-8", on_bad_lines="skip")
         else:
-            return pd.read_excel(path, engine="openpyxl")
+            # Excel: Rust-based calamine is much faster (pandas >= 2.2 + python-calamine);
+            # fall back to openpyxl if it isn't available.
+            try:
+                return pd.read_excel(path, engine="calamine")
+            except Exception:
+                return pd.read_excel(path, engine="openpyxl")
+
+    @staticmethod
+    def _sniff_sep(path: str) -> str:
+        with open(path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+            sample = f.read(4096)
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+        except csv.Error:
+            return ","
 
     # ---------- Preload-all with progress (fixed) ----------
     def _preload_all_images(self):
-        """Download + resize + decode ALL images; create PhotoImages and cache them.
+        """Download + resize + decode ALL images and cache them (PhotoImages are made on first show).
            Shows a modal progress dialog and enables navigation when finished.
         """
         urls = [r.image_url for r in self.rows if r.image_url]
@@ -224,53 +366,169 @@ class ListingsViewer(tk.Tk):
         dlg.update_idletasks()
         dlg.geometry("+%d+%d" % (self.winfo_rootx() + 60, self.winfo_rooty() + 60))
 
-        # Download/resize in threads; create PhotoImages on main thread
-        def download_resize(u: str) -> Tuple[str, Optional[bytes], Optional[str]]:
-            try:
-                resp = self.session.get(u, timeout=REQUEST_TIMEOUT)
-                resp.raise_for_status()
-                img = Image.open(io.BytesIO(resp.content)).convert("RGB")
-                img.thumbnail((MAX_W, MAX_H), Image.LANCZOS)
-                buf = io.BytesIO()
-                img.save(buf, format="PNG")
-                return u, buf.getvalue(), None
-            except Exception as e:
-                return u, None, str(e)
+        # Fit thumbnails to the panel they'll be shown in when it's smaller than MAX_W x MAX_H;
+        # never larger, so a big window doesn't grow every cached photo (or the disk cache)
+        self.update_idletasks()
+        size = (min(max(self.image_panel.winfo_width(), 256), MAX_W),
+                min(max(self.image_panel.winfo_height(), 256), MAX_H))
+        self._thumb_size = size
 
+        done = 0
         successes = 0
         failures = 0
+        finished: "deque[Tuple[str, Optional[Image.Image], Optional[str]]]" = deque()
+
+        # Runs on the Tk thread every FLUSH_MS: takes in everything finished since the last
+        # tick and updates the dialog once, instead of one event-loop wakeup per image.
+        # The Tk upload itself is left to show_current.
+        def flush():
+            nonlocal done, successes, failures
+            alive = worker.is_alive()  # checked first: once it's dead, everything is in `finished`
+            while finished:
+                url, img, error = finished.popleft()
+                done += 1
+                if img is not None:
+                    self.image_cache[url] = img
+                    successes += 1
+                else:
+                    failures += 1
+
+            pb["value"] = done
+            msg.config(text=f"{successes}/{total} downloaded"
+                            + (f" • {failures} failed" if failures else ""))
+
+            if done >= total or not alive:
+                # Close dialog & enable UI (also if the download thread died without reporting)
+                dlg.grab_release()
+                dlg.destroy()
+                self._enable_controls()
+                self.show_current()
+            else:
+                self.after(FLUSH_MS, flush)
 
-        # Use a thread pool to fetch/resize quickly
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-            futures = {ex.submit(download_resize, u): u for u in urls}
-            index = 0
-            for fut in as_completed(futures):
-                u, data, err = fut.result()
-                index += 1
-
-                # Create PhotoImage in main thread
-                def make_photo(url=u, blob=data, error=err, i=index):
-                    nonlocal successes, failures
-                    pb["value"] = i
-                    if blob is not None:
-                        img = Image.open(io.BytesIO(blob))
-                        tk_img = ImageTk.PhotoImage(img)
-                        self.image_cache[url] = tk_img
-                        successes += 1
-                        msg.config(text=f"{successes}/{total} downloaded")
-                    else:
-                        failures += 1
-                        msg.config(text=f"{successes}/{total} downloaded • {failures} failed")
-                    dlg.update_idletasks()
-
-                self.after(0, make_photo)
-
-        # Close dialog & enable UI (fixed: no bogus wait)
-        dlg.grab_release()
-        dlg.destroy()
+        # Called from the download threads; deque appends are thread-safe, so no Tk calls here
+        def post(url: str, img: Optional[Image.Image], error: Optional[str]):
+            finished.append((url, img, error))
 
-        self._enable_controls()
-        self.show_current()
+        # Download/resize in the background so the dialog stays responsive
+        worker = threading.Thread(target=self._download_all, args=(urls, size, post), daemon=True)
+        worker.start()
+        self.after(FLUSH_MS, flush)
+
+    def _download_all(self, urls: List[str], size: Tuple[int, int], post):
+        """Fetch + decode every URL off the Tk thread, reporting each via post(url, img, error)."""
+        reported = set()
+
+        def report(u: str, img: Optional[Image.Image], error: Optional[str]):
+            if u not in reported:
+                reported.add(u)
+                post(u, img, error)
+
+        try:
+            if _HAS_HTTPX:
+                asyncio.run(self._download_all_async(urls, size, report))
+            else:
+                self._download_all_threaded(urls, size, report)
+        except Exception as e:
+            # e.g. the decode processes couldn't start: fail whatever is left so the dialog closes
+            for u in urls:
+                report(u, None, str(e))
+
+    def _download_all_threaded(self, urls: List[str], size: Tuple[int, int], post):
+        def fetch(u: str) -> Tuple[Optional[RawImage], Optional[bytes]]:
+            # (decoded image, None) on a cache hit, else (None, downloaded bytes)
+            try:
+                blob = cache_path(u).read_bytes()
+            except OSError:
+                pass
+            else:
+                return decode_resize(blob, None, size), None  # already small: decode right here
+            resp = self.session.get(u, timeout=REQUEST_TIMEOUT)
+            resp.raise_for_status()
+            return None, resp.content
+
+        # I/O on a thread pool; each finished download goes straight to the decode processes,
+        # which are only started once something actually came from the network
+        decode_pool: Optional[ProcessPoolExecutor] = None
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as fetch_pool:
+                fetches = {fetch_pool.submit(fetch, u): u for u in urls}
+                for fut in as_completed(fetches):
+                    u = fetches[fut]
+                    try:
+                        raw, blob = fut.result()
+                    except Exception as e:
+                        post(u, None, str(e))
+                        continue
+                    if raw is not None:
+                        post(u, _image_from_raw(raw), None)
+                        continue
+                    if decode_pool is None:
+                        decode_pool = ProcessPoolExecutor(max_workers=DECODE_WORKERS)
+                    try:
+                        decoding = decode_pool.submit(decode_resize, blob, cache_path(u), size)
+                    except Exception as e:  # BrokenProcessPool: a worker died
+                        post(u, None, str(e))
+                        continue
+                    decoding.add_done_callback(lambda f, u=u: _post_decoded(post, u, f))
+        finally:
+            if decode_pool is not None:
+                decode_pool.shutdown()  # waits for the decodes still running
+
+    async def _download_all_async(self, urls: List[str], size: Tuple[int, int], post):
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(ASYNC_CONCURRENCY)
+        limits = httpx.Limits(max_connections=ASYNC_CONCURRENCY, max_keepalive_connections=ASYNC_CONCURRENCY)
+        timeout = httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0])
+
+        async def get(client: "httpx.AsyncClient", u: str) -> "httpx.Response":
+            # Same retry policy as the requests session: with this many GETs in flight,
+            # a 429/503 is more likely and usually goes away after a short wait
+            for attempt in range(RETRY_TOTAL + 1):
+                try:
+                    async with limit:
+                        resp = await client.get(u)
+                except httpx.TransportError:
+                    if attempt == RETRY_TOTAL:
+                        raise
+                else:
+                    if resp.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                        resp.raise_for_status()
+                        return resp
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+        decode_pool: Optional[ProcessPoolExecutor] = None
+
+        async def fetch_one(client: "httpx.AsyncClient", u: str):
+            nonlocal decode_pool
+            try:
+                path = cache_path(u)
+                try:
+                    blob = path.read_bytes()
+                except OSError:
+                    resp = await get(client, u)
+                    # Decode in another process so downloads keep flowing and all cores help;
+                    # the pool is only started once something actually came from the network
+                    if decode_pool is None:
+                        decode_pool = ProcessPoolExecutor(max_workers=DECODE_WORKERS)
+                    raw = await loop.run_in_executor(decode_pool, decode_resize, resp.content, path, size)
+                else:
+                    # Cached thumbnails already fit: a plain decode, cheaper than a trip to a process
+                    raw = await loop.run_in_executor(None, decode_resize, blob, None, size)
+                post(u, _image_from_raw(raw), None)
+            except Exception as e:
+                post(u, None, str(e))
+
+        # Connection is a hop-by-hop header that HTTP/2 forbids; httpx keeps connections alive anyway
+        h2_headers = {k: v for k, v in self.session.headers.items() if k.lower() != "connection"}
+        try:
+            async with httpx.AsyncClient(http2=True, limits=limits, timeout=timeout,
+                                         headers=h2_headers,
+                                         follow_redirects=True) as client:
+                await asyncio.gather(*(fetch_one(client, u) for u in urls))
+        finally:
+            if decode_pool is not None:
+                decode_pool.shutdown()
 
     def _enable_controls(self):
         have = self.idx >= 0
@@ -307,9 +565,17 @@ class ListingsViewer(tk.Tk):
             self.image_panel.config(image="", text="(no image)")
         else:
             photo = self.image_cache.get(url)
+            if isinstance(photo, Image.Image):
+                photo = ImageTk.PhotoImage(photo)
+                self.image_cache[url] = photo
+            elif photo is not None:
+                self.image_cache.move_to_end(url)
+            else:
+                photo = self._load_cached_photo(url)
             if photo is None:
-                # Shouldn't happen if we preloaded, but handle gracefully
-                self.image_panel.config(image="", text="(not preloaded)")
+                # Preload failed for this one, or it was evicted and isn't on disk: fetch it again
+                self._refetch(url)
+                self.image_panel.config(image="", text="(loading image…)")
                 self.current_photo = None
             else:
                 self.current_photo = photo
@@ -318,6 +584,52 @@ class ListingsViewer(tk.Tk):
         self.status_label.config(text=f"Row {self.idx + 1} of {len(self.rows)}")
         self._enable_controls()
 
+    def _load_cached_photo(self, url: str) -> Optional[ImageTk.PhotoImage]:
+        # Evicted from memory: the resized thumbnail on disk decodes in a few ms
+        try:
+            raw = decode_resize(cache_path(url).read_bytes(), None, self._thumb_size)
+        except Exception:
+            return None
+        photo = ImageTk.PhotoImage(_image_from_raw(raw))
+        self.image_cache[url] = photo
+        return photo
+
+    def _refetch(self, url: str):
+        if url in self._refetching:
+            return
+        if not self._refetching:
+            self.after(FLUSH_MS, self._poll_refetched)
+        self._refetching.add(url)
+        size = self._thumb_size
+
+        # Worker thread: no Tk calls; results are picked up by _poll_refetched like preload's flush()
+        def work():
+            try:
+                resp = self.session.get(url, timeout=REQUEST_TIMEOUT)
+                resp.raise_for_status()
+                img, error = _image_from_raw(decode_resize(resp.content, cache_path(url), size)), None
+            except Exception as e:
+                img, error = None, str(e)
+            self._refetched.append((url, img, error))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _poll_refetched(self):
+        while self._refetched:
+            self._install_refetched(*self._refetched.popleft())
+        if self._refetching:
+            self.after(FLUSH_MS, self._poll_refetched)
+
+    def _install_refetched(self, url: str, img: Optional[Image.Image], error: Optional[str]):
+        self._refetching.discard(url)
+        if img is not None:
+            self.image_cache[url] = img
+        if 0 <= self.idx < len(self.rows) and self.rows[self.idx].image_url == url:
+            if img is not None:
+                self.show_current()
+            else:
+                self.image_panel.config(image="", text=f"(image load failed)\n{error}")
+
     # ---------- Actions ----------
     def open_link(self):
         if self.idx < 0:
@@ -329,7 +641,15 @@ class ListingsViewer(tk.Tk):
         webbrowser.open(url)
 
 
+def _describe_pillow() -> str:
+    # pillow-simd versions carry a ".postN" suffix; libjpeg-turbo is what makes JPEG decode fast
+    simd = "SIMD" if ".post" in PIL.__version__ else "stock"
+    turbo = "libjpeg-turbo" if pil_features.check_feature("libjpeg_turbo") else "libjpeg"
+    return f"Pillow {PIL.__version__} ({simd}, {turbo})"
+
+
 def main():
+    print(_describe_pillow())
     app = ListingsViewer()
     app.mainloop()
 
@@ -340,6 +660,7 @@ if __name__ == "__main__":
     except ImportError as e:
         sys.stderr.write(
             f"Missing dependency: {e}\n"
-            "Install with: pip install pillow pandas openpyxl requests\n"
+            "Install with: pip install pillow pandas openpyxl requests (optional: python-calamine)\n"
+            "(For faster image decode/resize use pillow-simd built against libjpeg-turbo instead of pillow.)\n"
         )
         raise
@@ -7,15 +7,20 @@ Listings Viewer (Excel or CSV)
 """
 
 import io
+import csv
 import sys
 import os
+import sqlite3
 import webbrowser
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 import requests
 import pandas as pd
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, features as pil_features
+import PIL
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
@@ -31,6 +36,52 @@ except Exception:
 MAX_W = 640
 MAX_H = 640
 
+# PhotoImages kept in memory (least recently shown are dropped and re-fetched if needed)
+IMAGE_CACHE_MAX = 256
+
+# Titles are sent to the translator in chunks; a few chunks run in parallel
+TRANSLATE_BATCH = 50
+TRANSLATE_WORKERS = 4
+
+# Translations are kept across runs so re-opening an export doesn't re-hit the translator
+TRANSLATION_DB = os.path.join(os.path.expanduser("~"), ".cache", "listings_viewer", "translations.sqlite")
+
+
+class LRU(OrderedDict):
+    """Dict that drops its least-recently-used entries beyond maxsize.
+
+    Callers mark a hit with move_to_end(); plain lookups don't reorder.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def download_resize(url: str) -> Image.Image:
+    """GET an image and fit it within MAX_W x MAX_H (raises on failure)."""
+    resp = requests.get(url, timeout=20)
+    resp.raise_for_status()
+    img = Image.open(io.BytesIO(resp.content))
+    # Let libjpeg decode at 1/2, 1/4 or 1/8 scale before converting (no-op for non-JPEG)
+    img.draft("RGB", (MAX_W * 2, MAX_H * 2))
+    if img.mode != "RGB":  # JPEGs usually decode straight to RGB; convert() would just copy
+        img = img.convert("RGB")
+    # Fit within MAX_W x MAX_H while preserving aspect; the remaining <= 2x step
+    # doesn't need LANCZOS
+    img.thumbnail((MAX_W, MAX_H), Image.BILINEAR)
+    return img
+
+
+# Column names load_table looks for (matched case-insensitively)
+CANONICAL = ("image_url", "image", "image link", "title_en", "title", "detail_url")
+
 
 @dataclass
 class ListingRow:
@@ -86,11 +137,15 @@ class ListingsViewer(tk.Tk):
         # Data
         self.rows: list[ListingRow] = []
         self.idx: int = -1
-        self.image_cache: Dict[str, ImageTk.PhotoImage] = {}
+        self.image_cache: "LRU[str, ImageTk.PhotoImage]" = LRU(IMAGE_CACHE_MAX)
         self.current_photo: Optional[ImageTk.PhotoImage] = None
 
+        # Neighbouring rows' images are fetched in the background so Next/Previous hit the cache
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        self._prefetching: dict[str, Future] = {}
+
         # Translation helpers
-        self._translation_cache: Dict[str, str] = {}
+        self._tr_db = self._open_translation_db()
         self._warned_no_translation = False
 
     # ---------- File loading ----------
@@ -114,51 +169,47 @@ class ListingsViewer(tk.Tk):
 
         # Normalize/locate columns (case-insensitive)
         cols_map = {c.strip().lower(): c for c in df.columns if isinstance(c, str)}
-        def col(name): return cols_map.get(name)
+        found = {k: cols_map.get(k) for k in CANONICAL}
 
-        image_col = col("image_url") or col("image") or col("image link")
-        title_en_col = col("title_en")
-        title_col = col("title")
-        detail_col = col("detail_url")
+        image_col = found["image_url"] or found["image"] or found["image link"]
+        title_en_col = found["title_en"]
+        title_col = found["title"]
+        detail_col = found["detail_url"]
 
         if not image_col:
             messagebox.showerror("Missing column", "Could not find an 'image_url' column.")
             return
 
-        rows: list[ListingRow] = []
-        for _, r in df.iterrows():
-            # Raw values
-            t_en = r.get(title_en_col) if title_en_col else None
-            t = r.get(title_col) if title_col else None
-
-            # Normalize to strings where possible
-            t_en_str = self._coerce_to_str(t_en)
-            t_str = self._coerce_to_str(t)
-
-            # Decide title (prefer title_en). If title_en is a formula or empty, auto-translate from title.
-            title = None
-            if t_en_str and not t_en_str.lstrip().startswith("="):
-                # Use title_en as-is if it's plain text
-                title = t_en_str.strip()
-            else:
-                # title_en missing or looks like a formula -> try translating from original title
-                src_text = (t_str or "").strip()
-                title = self._translate_to_en(src_text) or t_en_str or t_str or "(no title)"
-
-            # Clean image/detail URLs
-            image_url = r.get(image_col)
-            if isinstance(image_url, str):
-                image_url = image_url.strip().strip('"').strip("'")
-            else:
-                image_url = None
-
-            detail_url = r.get(detail_col) if detail_col else None
-            if isinstance(detail_url, str):
-                detail_url = detail_url.strip()
-            else:
-                detail_url = None
-
-            rows.append(ListingRow(title=title, image_url=image_url, detail_url=detail_url))
+        def text(name) -> pd.Series:
+            # Stripped string column; empty cells (or a missing column) become <NA>
+            if not name:
+                return pd.Series(pd.NA, index=df.index, dtype="string")
+            return df[name].astype("string").str.strip().replace("", pd.NA)
+
+        def optional(s: pd.Series) -> list:
+            return s.astype(object).where(s.notna(), None).tolist()
+
+        # Decide title (prefer title_en). If title_en is a formula or empty, auto-translate from title.
+        titles_en = text(title_en_col)
+        titles_src = text(title_col)
+        use_en = titles_en.notna() & ~titles_en.str.startswith("=", na=False)
+
+        # Only the rows without a usable title_en need a translation; do them all up front
+        titles = optional(titles_en.where(use_en))
+        fallback = ~use_en.to_numpy()
+        to_translate = optional(titles_src[fallback])
+        self._translate_many(to_translate)
+        for i, t_en, t in zip(fallback.nonzero()[0], optional(titles_en[fallback]), to_translate):
+            titles[i] = self._get_tr(t) or t_en or t or "(no title)"
+
+        # Clean image/detail URLs
+        image_urls = text(image_col).str.strip('"').str.strip("'")
+        detail_urls = text(detail_col)
+
+        rows: list[ListingRow] = [
+            ListingRow(title=t, image_url=u, detail_url=d)
+            for t, u, d in zip(titles, optional(image_urls), optional(detail_urls))
+        ]
 
         self.rows = rows
         self.idx = 0 if self.rows else -1
@@ -170,33 +221,80 @@ class ListingsViewer(tk.Tk):
     def _read_any_table(self, path: str) -> pd.DataFrame:
         ext = os.path.splitext(path)[1].lower()
         if ext == ".csv":
+            # Fast path: pyarrow's multithreaded parser. It can't auto-detect the
+            # delimiter, so sniff it once from the first 4 KB.
+            try:
+                return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow",
+                                   sep=self._sniff_sep(path), encoding="utf-8-sig")
+            except Exception:
+                pass
             # Try to auto-detect delimiter; BOM-safe; skip bad lines if any.
             try:
                 return pd.read_csv(path, engine="python", sep=None, encoding="utf-8-sig", on_bad_lines="skip")
             except Exception:
                 return pd.read_csv(path, encoding="utf-8", on_bad_lines="skip")
         else:
-            # Excel
-            return pd.read_excel(path, engine="openpyxl")
+            # Excel: Rust-based calamine is much faster (pandas >= 2.2 + python-calamine);
+            # fall back to openpyxl if it isn't available.
+            try:
+                return pd.read_excel(path, engine="calamine")
+            except Exception:
+                return pd.read_excel(path, engine="openpyxl")
+
+    @staticmethod
+    def _sniff_sep(path: str) -> str:
+        with open(path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+            sample = f.read(4096)
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+        except csv.Error:
+            return ","
 
     # ---------- Translation helpers ----------
-    def _coerce_to_str(self, v) -> Optional[str]:
-        if isinstance(v, str):
-            s = v.strip()
-            return s if s else None
-        if isinstance(v, (int, float)) and pd.notna(v):
-            return str(v)
-        return None
-
-    def _translate_to_en(self, text: Optional[str]) -> Optional[str]:
+    @staticmethod
+    def _open_translation_db() -> sqlite3.Connection:
+        schema = "CREATE TABLE IF NOT EXISTS tr(src TEXT PRIMARY KEY, dst TEXT)"
+        db = None
+        try:
+            os.makedirs(os.path.dirname(TRANSLATION_DB), exist_ok=True)
+            db = sqlite3.connect(TRANSLATION_DB)
+            db.execute(schema)  # also where a corrupt file shows up ("file is not a database")
+            return db
+        except (OSError, sqlite3.Error):
+            if db is not None:
+                db.close()
+        # Cache dir not writable or the file is damaged: keep translations for this run only
+        db = sqlite3.connect(":memory:")
+        db.execute(schema)
+        return db
+
+    def _get_tr(self, src: Optional[str]) -> Optional[str]:
+        if not src:
+            return None
+        row = self._tr_db.execute("SELECT dst FROM tr WHERE src = ?", (src,)).fetchone()
+        return row[0] if row else None
+
+    def _put_tr(self, pairs) -> None:
+        # (src, dst) pairs; written in a single transaction
+        try:
+            with self._tr_db:
+                self._tr_db.executemany("INSERT OR REPLACE INTO tr(src, dst) VALUES (?, ?)", pairs)
+        except sqlite3.Error:
+            pass
+
+    def destroy(self):
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._tr_db.close()
+        super().destroy()
+
+    def _translate_many(self, texts: List[Optional[str]]) -> None:
         """
-        Translate source text to English using deep-translator (if available).
-        Caches results and fails gracefully.
+        Translate all not-yet-cached texts to English using deep-translator (if available)
+        and store them in the on-disk cache. Batches run on a small thread pool; fails gracefully.
         """
-        if not text:
-            return None
-        if text in self._translation_cache:
-            return self._translation_cache[text]
+        todo = [t for t in dict.fromkeys(texts) if t and self._get_tr(t) is None]
+        if not todo:
+            return
 
         if not _HAS_DEEP:
             # Warn once per run that translation isn't available
@@ -208,24 +306,37 @@ class ListingsViewer(tk.Tk):
                     "Showing original text instead."
                 )
                 self._warned_no_translation = True
-            return None
+            return
 
-        try:
-            translated = GoogleTranslator(source="auto", target="en").translate(text)
-            translated = (translated or "").strip()
-            if translated:
-                self._translation_cache[text] = translated
-                return translated
-        except Exception as e:
-            # On any failure, warn once and fall back.
-            if not self._warned_no_translation:
-                messagebox.showwarning(
-                    "Translation failed",
-                    f"Could not translate some titles automatically:\n{e}\n\n"
-                    "Showing original text instead."
-                )
-                self._warned_no_translation = True
-        return None
+        def translate(batch: List[str]):
+            # translate_batch() would just loop translate() and drop the whole chunk on the
+            # first error, so go title by title and keep whatever succeeded
+            translator = GoogleTranslator(source="auto", target="en")
+            done, error = [], None
+            for src in batch:
+                try:
+                    dst = (translator.translate(src) or "").strip()
+                except Exception as e:
+                    error = e
+                    continue
+                if dst:
+                    done.append((src, dst))
+            return done, error
+
+        batches = [todo[i:i + TRANSLATE_BATCH] for i in range(0, len(todo), TRANSLATE_BATCH)]
+        with ThreadPoolExecutor(max_workers=min(TRANSLATE_WORKERS, len(batches))) as pool:
+            futures = [pool.submit(translate, b) for b in batches]
+            for fut in as_completed(futures):
+                translated, e = fut.result()
+                self._put_tr(translated)  # one transaction per chunk
+                if e is not None and not self._warned_no_translation:
+                    # On any failure, warn once and fall back.
+                    messagebox.showwarning(
+                        "Translation failed",
+                        f"Could not translate some titles automatically:\n{e}\n\n"
+                        "Showing original text instead."
+                    )
+                    self._warned_no_translation = True
 
     # ---------- Navigation ----------
     def prev_row(self):
@@ -267,25 +378,56 @@ class ListingsViewer(tk.Tk):
         self.status_label.config(text=f"Row {self.idx + 1} of {len(self.rows)}")
         self.update_controls()
 
+        for j in (self.idx + 1, self.idx - 1):
+            if 0 <= j < len(self.rows):
+                self._prefetch(self.rows[j].image_url)
+
     def fetch_image(self, url: Optional[str]) -> Optional[ImageTk.PhotoImage]:
         if not url:
             return None
         if url in self.image_cache:
+            self.image_cache.move_to_end(url)
             return self.image_cache[url]
+        fut = self._prefetching.pop(url, None)
+        img = None
+        if fut is not None and not fut.cancel():
+            try:
+                img = fut.result()  # already downloading: wait for it rather than fetching twice
+            except Exception:
+                pass  # the prefetch failed: retry below, so errors are reported from a fresh try
         try:
-            resp = requests.get(url, timeout=20)
-            resp.raise_for_status()
-            img = Image.open(io.BytesIO(resp.content)).convert("RGB")
+            if img is None:
+                img = download_resize(url)
         except Exception as e:
             self.image_panel.config(text=f"(image load failed)\n{e}", image="")
             return None
 
-        # Fit within MAX_W x MAX_H while preserving aspect
-        img.thumbnail((MAX_W, MAX_H), Image.LANCZOS)
         tk_img = ImageTk.PhotoImage(img)
         self.image_cache[url] = tk_img
         return tk_img
 
+    def _prefetch(self, url: Optional[str]):
+        if not url or url in self.image_cache or url in self._prefetching:
+            return
+        # Worker thread: network + decode only; the PhotoImage must be made on the Tk thread
+        fut = self._prefetch_pool.submit(download_resize, url)
+        self._prefetching[url] = fut
+        fut.add_done_callback(lambda f: self._on_prefetched(url, f))
+
+    def _on_prefetched(self, url: str, fut: Future):
+        try:
+            self.after(0, self._promote_prefetched, url, fut)
+        except (RuntimeError, tk.TclError):
+            pass  # window closed
+
+    def _promote_prefetched(self, url: str, fut: Future):
+        if self._prefetching.get(url) is not fut:
+            return  # fetch_image already took this one over
+        del self._prefetching[url]
+        # On failure, fetch_image will retry and report the error if the row is shown
+        if not fut.cancelled() and fut.exception() is None and url not in self.image_cache:
+            self.image_cache[url] = ImageTk.PhotoImage(fut.result())
+
     # ---------- Actions ----------
     def open_link(self):
         if self.idx < 0:
@@ -297,7 +439,15 @@ class ListingsViewer(tk.Tk):
         webbrowser.open(url)
 
 
+def _describe_pillow() -> str:
+    # pillow-simd versions carry a ".postN" suffix; libjpeg-turbo is what makes JPEG decode fast
+    simd = "SIMD" if ".post" in PIL.__version__ else "stock"
+    turbo = "libjpeg-turbo" if pil_features.check_feature("libjpeg_turbo") else "libjpeg"
+    return f"Pillow {PIL.__version__} ({simd}, {turbo})"
+
+
 def main():
+    print(_describe_pillow())
     app = ListingsViewer()
     app.mainloop()
 
@@ -308,6 +458,7 @@ if __name__ == "__main__":
     except ImportError as e:
         sys.stderr.write(
             f"Missing dependency: {e}\n"
-            "Install with: pip install pillow pandas openpyxl requests deep-translator\n"
+            "Install with: pip install pillow pandas openpyxl requests deep-translator (optional: python-calamine)\n"
+            "(For faster image decode/resize use pillow-simd built against libjpeg-turbo instead of pillow.)\n"
         )
         raise